@@ -19,6 +19,17 @@ Esempi:
   python pdf_3col_to_txt_parity_boxes.py \
       --pdf in.pdf --out out.txt \
       --odd-cols "0%:33.3%,33.3%:66.6%,66.6%:100%"
+
+  # Motore PyMuPDF (più veloce) su 4 processi paralleli
+  python pdf_3col_to_txt_parity_boxes.py \
+      --pdf in.pdf --out out.txt --engine fitz --workers 4
+
+Le colonne (punti o percentuali) sono misurate dal bordo sinistro del
+cropbox della pagina. --workers imposta il numero di processi (default:
+numero di CPU); --engine sceglie il backend: pdfplumber (default) o fitz.
+
+Dipendenze: pdfplumber; PyMuPDF (pip install pymupdf) è opzionale e serve
+solo con --engine fitz.
       
 Usage with the INIS 2018 pdf file:
 
@@ -32,16 +43,43 @@ then merge the two txt files.
 
 from __future__ import annotations
 import argparse
+import io
+from bisect import bisect_right
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
 import sys
-from typing import List, Tuple, Optional
-import pdfplumber
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple, Optional
+
+if TYPE_CHECKING:  # imported lazily at run time
+    import fitz
+    import pdfplumber
+
+
+# Ligatures and special spaces, normalized in one str.translate pass
+_LIG_TABLE = str.maketrans({
+    "\ufb00": "ff",
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    "\u00a0": " ",  # no-break space
+    "\u2009": " ",  # thin space
+    "\u200b": "",   # zero-width space
+})
 
 
 def clean_lines(text: str) -> str:
-    """Reduce consecutive blank lines while preserving paragraphs."""
+    """
+    Normalize ligatures and special spaces, then reduce consecutive blank
+    lines while preserving paragraphs.
+    """
     if not text:
         return ""
+    text = text.translate(_LIG_TABLE)
     lines = [ln.rstrip() for ln in text.splitlines()]
     out = []
     last_blank = False
@@ -75,8 +113,11 @@ def parse_cols_spec(spec: str, width: float) -> List[Tuple[float, float]]:
     boxes: List[Tuple[float, float]] = []
     if not spec:
         return boxes
-    parts = [p for p in spec.split(",") if p.strip()]
-    for p in parts:
+    in_order = True
+    last_x1 = float("-inf")
+    for p in spec.split(","):
+        if not p.strip():
+            continue
         if ":" not in p:
             raise ValueError(f"Invalid column spec: '{p}' (missing ':')")
         a, b = p.split(":", 1)
@@ -84,7 +125,13 @@ def parse_cols_spec(spec: str, width: float) -> List[Tuple[float, float]]:
         x1 = _parse_coord(b, width)
         if x1 <= x0:
             raise ValueError(f"Box with x1<=x0: '{p}' → ({x0}, {x1})")
+        if x0 < last_x1:
+            in_order = False
+        last_x1 = x1
         boxes.append((x0, x1))
+    if in_order:
+        # Already ordered left→right without overlaps
+        return boxes
     # Sanity checks for overlaps and ordering
     boxes_sorted = sorted(boxes, key=lambda t: t[0])
     for i in range(1, len(boxes_sorted)):
@@ -105,168 +152,404 @@ def equal_columns(width: float, n: int) -> List[Tuple[float, float]]:
     return cols
 
 
+@lru_cache(maxsize=8)
+def _col_boxes_for(
+    spec: Optional[str], width: float, default_cols: int
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    Column boxes for a spec at a given page width, or 'default_cols' equal
+    columns when there is no spec. Memoized: page widths rarely vary within
+    a PDF, so each spec is parsed once per worker.
+    """
+    if spec:
+        return tuple(parse_cols_spec(spec, width))
+    return tuple(equal_columns(width, default_cols))
+
+
 # ---------------------- Bold-aware text reconstruction ---------------------- #
 
 _BOLD_TOKENS = (
     "bold", "bd", "black", "heavy", "semibold", "demi", "mediumbold"
 )
+_BOLD_RE = re.compile("|".join(_BOLD_TOKENS), re.IGNORECASE)
+# A PDF uses only a handful of fonts: remember the verdict per font name
+_BOLD_CACHE: Dict[str, bool] = {}
 
 def _looks_bold(fontname: str) -> bool:
     """
     Heuristic to decide whether a font name indicates a bold weight.
     """
-    if not fontname:
-        return False
-    fn = fontname.lower()
-    return any(tok in fn for tok in _BOLD_TOKENS)
-
-
-def _group_chars_into_lines(chars: List[dict], line_tol: float) -> List[List[dict]]:
-    """
-    Group chars into lines using the 'top' coordinate with a tolerance.
-    Returns a list of lines; each line is a list of char dicts.
-    """
-    if not chars:
-        return []
-
-    # Sort by vertical position then by x
-    chars_sorted = sorted(chars, key=lambda c: (round(c.get("top", 0.0), 3), c.get("x0", 0.0)))
-    lines: List[List[dict]] = []
-    current_line: List[dict] = []
-    current_top: Optional[float] = None
-
-    for ch in chars_sorted:
-        ch_top = ch.get("top", 0.0)
-        if current_line and current_top is not None:
-            # New line if vertical distance exceeds tolerance
-            if abs(ch_top - current_top) > line_tol:
-                # finalize previous
-                lines.append(sorted(current_line, key=lambda c: c.get("x0", 0.0)))
-                current_line = [ch]
-                current_top = ch_top
-            else:
-                current_line.append(ch)
-        else:
-            current_line = [ch]
-            current_top = ch_top
-
-    if current_line:
-        lines.append(sorted(current_line, key=lambda c: c.get("x0", 0.0)))
-
-    return lines
-
-
-def _reconstruct_line_with_bold(line_chars: List[dict], gap_ratio: float = 0.5) -> str:
-    """
-    Reconstruct a single text line from ordered chars, inserting spaces when the
-    x-gap suggests a word boundary, and wrapping bold runs in <bold>…</bold>.
-    """
-    if not line_chars:
-        return ""
-
-    out: List[str] = []
-    in_bold = False
-    prev_x1 = None
-    prev_w = None
-
-    for ch in line_chars:
-        txt = ch.get("text", "")
-        if not txt:
-            continue
-
-        x0 = ch.get("x0", None)
-        x1 = ch.get("x1", None)
-        w = None
-        if x0 is not None and x1 is not None:
-            w = max(0.0, x1 - x0)
+    v = _BOLD_CACHE.get(fontname)
+    if v is None:
+        v = bool(fontname) and _BOLD_RE.search(fontname) is not None
+        _BOLD_CACHE[fontname] = v
+    return v
 
-        # Space heuristic: if there is a noticeable gap, insert a space
-        if prev_x1 is not None and x0 is not None:
-            avg_char_w = prev_w if prev_w is not None and prev_w > 0 else 3.0
-            if (x0 - prev_x1) > gap_ratio * avg_char_w:
-                out.append(" ")
 
-        # Bold state management
-        is_bold = _looks_bold(ch.get("fontname", ""))
+_WORD_X0 = itemgetter("x0")
 
-        if is_bold and not in_bold:
-            out.append("<bold>")
-            in_bold = True
-        elif not is_bold and in_bold:
-            out.append("</bold>")
-            in_bold = False
+# Default word split: x-gap larger than this fraction of the font size
+# (about half a char width, as the old per-char space heuristic used)
+_WORD_GAP_RATIO = 0.25
 
-        out.append(txt)
 
-        prev_x1 = x1
-        prev_w = w
+def _words_to_text(
+    words: List[dict],
+    line_tol: float,
+    gap_ratio: float = 0.15,
+    bold_attr: str = "fontname",
+    bold_of: Callable[[Any], bool] = _looks_bold,
+) -> str:
+    """
+    Lay out words (as returned by pdfplumber's extract_words) as text:
+      - group words into lines using 'top' with a tolerance,
+      - order each line by x0 and join words with a single space, unless
+        two adjacent words differ in bold_attr and the x-gap is about zero
+        (within gap_ratio of the previous word's average char width, well
+        below a space glyph): one word split by a font change,
+      - wrap bold runs in <bold>…</bold>; bold_of(word[bold_attr]) tells
+        whether a word is bold.
+    Text of consecutive words in the same bold state is written in one go.
+    """
+    if not words:
+        return ""
 
-    # Close tag if line ended in bold
-    if in_bold:
-        out.append("</bold>")
+    buf = io.StringIO()
+    write = buf.write
+    run: List[str] = []
+    append = run.append
+
+    def emit_line(line: List[dict]) -> None:
+        in_bold = False
+        prev = None
+        for w in sorted(line, key=_WORD_X0):
+            space = False
+            if prev is not None:
+                space = True
+                if w[bold_attr] != prev[bold_attr]:
+                    avg_char_w = (prev["x1"] - prev["x0"]) / max(1, len(prev["text"]))
+                    space = w["x0"] - prev["x1"] > gap_ratio * avg_char_w
+            prev = w
+
+            # Bold state management: on a toggle the space goes after a
+            # closing tag and before an opening one, never inside the tags
+            is_bold = bold_of(w[bold_attr])
+            if is_bold != in_bold:
+                write("".join(run))
+                run.clear()
+                if in_bold:
+                    write("</bold>")
+                if space:
+                    write(" ")
+                if is_bold:
+                    write("<bold>")
+                in_bold = is_bold
+            elif space:
+                append(" ")
+
+            append(w["text"])
+
+        write("".join(run))
+        run.clear()
+        # Close tag if line ended in bold
+        if in_bold:
+            write("</bold>")
+
+    # Quantize 'top' into integer buckets of line_tol once. Words in the
+    # same bucket as the line's first word are on that line (one integer
+    # compare); on a bucket change, a new line starts only if the word is
+    # more than line_tol below the line's first word.
+    keyed = sorted(
+        (int(w["top"] // line_tol), w["top"], w["x0"], i)
+        for i, w in enumerate(words)
+    )
+    line_bucket, line_top = keyed[0][0], keyed[0][1]
+    line: List[dict] = []
+    for bucket, top, _, i in keyed:
+        if bucket != line_bucket and top - line_top > line_tol:
+            emit_line(line)
+            write("\n")
+            line = []
+            line_bucket, line_top = bucket, top
+        line.append(words[i])
+    emit_line(line)
 
-    return "".join(out)
+    return buf.getvalue()
 
 
 def extract_text_with_bold(
-    page: "pdfplumber.page.Page",
-    bbox: Tuple[float, float, float, float],
+    chars: List[dict],
     line_tol: float,
+    x_tolerance: Optional[float] = None,
+    bold_attr: str = "fontname",
+    bold_of: Callable[[Any], bool] = _looks_bold,
 ) -> str:
     """
-    Extract text within bbox using per-char reconstruction and bold tagging.
+    Build text from the chars of one column with pdfplumber's word
+    extraction, then lay words out in lines with bold tagging.
+    Words split at blank chars and at x-gaps above x_tolerance points, or
+    above _WORD_GAP_RATIO of the font size when x_tolerance is None.
     """
-    cp = page.crop(bbox)
-    chars = cp.chars or []
-    # Group into lines by 'top'
-    lines = _group_chars_into_lines(chars, line_tol=line_tol)
-
-    # Build line strings
-    s_lines = []
-    for line_chars in lines:
-        s_lines.append(_reconstruct_line_with_bold(line_chars))
-
-    # Join with newlines, then light cleanup
-    return clean_lines("\n".join(s_lines))
+    from pdfplumber.utils import extract_words
+
+    if x_tolerance is None:
+        split = {"x_tolerance_ratio": _WORD_GAP_RATIO}
+    else:
+        split = {"x_tolerance": x_tolerance}
+    words = extract_words(
+        chars,
+        y_tolerance=line_tol,
+        keep_blank_chars=False,
+        extra_attrs=[bold_attr],
+        **split,
+    )
+    # Light cleanup on the reconstructed lines
+    return clean_lines(_words_to_text(
+        words,
+        line_tol=line_tol,
+        bold_attr=bold_attr,
+        bold_of=bold_of,
+    ))
 
 
 # --------------------------- Column-wise extraction ------------------------- #
 
-def extract_page_columns(
-    page: "pdfplumber.page.Page",
-    col_boxes: List[Tuple[float, float]],
+def extract_chars_columns(
+    chars: List[dict],
+    page_box: Tuple[float, float, float, float],
+    col_boxes: Sequence[Tuple[float, float]],
     header_ratio: float,
     footer_ratio: float,
-    x_tolerance: float,  # kept for interface parity (not used directly)
+    x_tolerance: Optional[float],
     y_tolerance: float,
+    bold_attr: str = "fontname",
+    bold_of: Callable[[Any], bool] = _looks_bold,
 ) -> str:
     """
-    Extract text for each column box left→right using bold-aware reconstruction.
+    Extract text for each column box left→right from a page's chars
+    (pdfplumber-shaped dicts, top measured from the page top).
+    'page_box' is the visible area (x0, top, x1, bottom) in the same
+    coordinates, i.e. the cropbox: header/footer ratios apply to its
+    height, and column boxes are measured from its left edge and clamped
+    to its width.
+    Header/footer are dropped and chars are bucketed into columns by their
+    x0 in a single pass, using bisect over the sorted column edges.
     """
-    W, H = page.width, page.height
-    y0 = H * header_ratio
-    y1 = H * (1.0 - footer_ratio)
+    bx0, btop, bx1, bbottom = page_box
+    H = bbottom - btop
+    y0 = btop + H * header_ratio
+    y1 = bbottom - H * footer_ratio
     if y1 <= y0:
-        y0, y1 = 0, H
+        y0, y1 = btop, bbottom
 
-    col_texts: List[str] = []
+    boxes: List[Tuple[float, float]] = []
     for (x0, x1) in col_boxes:
-        # Clamp prudentially
-        xx0 = max(0.0, min(W, x0))
-        xx1 = max(0.0, min(W, x1))
+        # Shift to page coordinates, then clamp prudentially
+        xx0 = max(bx0, min(bx1, bx0 + x0))
+        xx1 = max(bx0, min(bx1, bx0 + x1))
         if xx1 <= xx0:
             continue
+        boxes.append((xx0, xx1))
+    boxes.sort()
+
+    # edges = [x0_0, x1_0, x0_1, x1_1, ...]: an even slot means "inside a box"
+    edges = [x for box in boxes for x in box]
+    buckets: List[List[dict]] = [[] for _ in boxes]
+    for c in chars:
+        if not (y0 <= c["top"] <= y1):
+            continue
+        idx = bisect_right(edges, c["x0"]) - 1
+        if idx >= 0 and not idx & 1:
+            buckets[idx >> 1].append(c)
 
+    col_texts: List[str] = []
+    for bucket in buckets:
         t = extract_text_with_bold(
-            page=page,
-            bbox=(xx0, y0, xx1, y1),
+            chars=bucket,
             line_tol=max(1.0, y_tolerance),
+            x_tolerance=x_tolerance,
+            bold_attr=bold_attr,
+            bold_of=bold_of,
         )
         if t:
             col_texts.append(clean_lines(t))
     return "\n\n".join([t for t in col_texts if t])
 
 
+def extract_page_columns(
+    page: "pdfplumber.page.Page",
+    col_boxes: Sequence[Tuple[float, float]],
+    header_ratio: float,
+    footer_ratio: float,
+    x_tolerance: Optional[float],
+    y_tolerance: float,
+) -> str:
+    """
+    Extract text for each column box left→right using bold-aware reconstruction.
+    Reads page.chars once instead of cropping the page once per column.
+    Header/footer and column boxes are measured on the page's cropbox
+    (pdfplumber falls back to the mediabox when the page has none): column
+    boxes are relative to the cropbox's left edge.
+    """
+    return extract_chars_columns(
+        chars=page.chars or [],
+        page_box=page.cropbox,
+        col_boxes=col_boxes,
+        header_ratio=header_ratio,
+        footer_ratio=footer_ratio,
+        x_tolerance=x_tolerance,
+        y_tolerance=y_tolerance,
+    )
+
+
+# ------------------------------ PyMuPDF engine ------------------------------ #
+
+def _import_fitz():
+    """Import PyMuPDF (optional dependency) under its current or legacy name."""
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz
+    return fitz
+
+
+_FITZ_BOLD_FLAG = 16  # span["flags"] bit set by MuPDF for bold fonts
+
+
+def _fitz_page_chars(page: "fitz.Page") -> List[dict]:
+    """
+    Flatten a PyMuPDF page's rawdict (blocks→lines→spans→chars) into char
+    dicts shaped like pdfplumber's (the keys its word extraction reads),
+    plus a 'bold' flag taken from the span flags.
+    """
+    chars: List[dict] = []
+    append = chars.append
+    fitz = _import_fitz()
+    # Keep MuPDF from synthesizing space chars out of x-gaps: word splitting
+    # is left to extract_words, as for pdfplumber
+    raw = page.get_text(
+        "rawdict", flags=fitz.TEXTFLAGS_RAWDICT | fitz.TEXT_INHIBIT_SPACES
+    )
+    for block in raw["blocks"]:
+        for line in block.get("lines", ()):
+            upright = line["dir"] == (1.0, 0.0)
+            for span in line["spans"]:
+                fontname = span["font"]
+                size = span["size"]
+                bold = bool(span["flags"] & _FITZ_BOLD_FLAG)
+                for ch in span["chars"]:
+                    x0, top, x1, bottom = ch["bbox"]
+                    append({
+                        "text": ch["c"],
+                        "x0": x0,
+                        "x1": x1,
+                        "top": top,
+                        "bottom": bottom,
+                        "doctop": top,
+                        "upright": upright,
+                        "fontname": fontname,
+                        "size": size,
+                        "bold": bold,
+                    })
+    return chars
+
+
+def _count_pages(pdf: "pdfplumber.PDF") -> int:
+    """
+    Count pages by walking the page tree, without building a
+    pdfplumber Page for each of them (as len(pdf.pages) would).
+    """
+    from pdfminer.pdfpage import PDFPage
+
+    return sum(1 for _ in PDFPage.create_pages(pdf.doc))
+
+
+# Document opened once per worker process by _init_worker, and the 0-based
+# index of the first page it holds (pdfplumber only keeps the page range)
+_WORKER_DOC: Any = None
+_WORKER_FIRST_IDX0 = 0
+
+
+def _init_worker(pdf_path: Path, engine: str, first_page: int, last_page: int) -> None:
+    """
+    Process-pool initializer: open the PDF once per worker process and keep
+    it in _WORKER_DOC for every page that process extracts (pdfplumber
+    objects cannot be pickled, and reopening the PDF per page is slow).
+    Pages are 1-based and inclusive. pdfplumber still walks the whole page
+    tree once, but only builds Page objects for first_page..last_page.
+    The document is released when the worker process exits.
+    """
+    global _WORKER_DOC, _WORKER_FIRST_IDX0
+    if engine == "fitz":
+        # PyMuPDF loads pages on demand: keep absolute indices
+        _WORKER_DOC = _import_fitz().open(str(pdf_path))
+        _WORKER_FIRST_IDX0 = 0
+    else:
+        import pdfplumber
+
+        _WORKER_DOC = pdfplumber.open(
+            str(pdf_path), pages=range(first_page, last_page + 1)
+        )
+        _WORKER_FIRST_IDX0 = first_page - 1
+
+
+def _extract_one_page(
+    idx0: int,
+    odd_cols_spec: Optional[str],
+    even_cols_spec: Optional[str],
+    header_ratio: float,
+    footer_ratio: float,
+    x_tolerance: Optional[float],
+    y_tolerance: float,
+    default_cols: int,
+    engine: str = "pdfplumber",
+) -> Tuple[int, str]:
+    """
+    Process-pool worker: extract a single page (0-based idx0) from the
+    document opened by _init_worker.
+    Returns (idx0, page_text).
+    """
+    page_num = idx0 + 1  # 1-based
+    # Choose boxes: odd vs even
+    spec = odd_cols_spec if (page_num % 2) == 1 else even_cols_spec
+
+    if engine == "fitz":
+        page = _WORKER_DOC[idx0]
+        W, H = page.rect.width, page.rect.height
+        page_text = extract_chars_columns(
+            chars=_fitz_page_chars(page),
+            # MuPDF coordinates are already relative to the cropbox
+            page_box=(0.0, 0.0, W, H),
+            col_boxes=_col_boxes_for(spec, W, default_cols),
+            header_ratio=header_ratio,
+            footer_ratio=footer_ratio,
+            x_tolerance=x_tolerance,
+            y_tolerance=y_tolerance,
+            bold_attr="bold",
+            bold_of=bool,
+        )
+        return idx0, page_text
+
+    page = _WORKER_DOC.pages[idx0 - _WORKER_FIRST_IDX0]
+    cb = page.cropbox
+    W = cb[2] - cb[0]
+    col_boxes = _col_boxes_for(spec, W, default_cols)
+
+    try:
+        page_text = extract_page_columns(
+            page=page,
+            col_boxes=col_boxes,
+            header_ratio=header_ratio,
+            footer_ratio=footer_ratio,
+            x_tolerance=x_tolerance,
+            y_tolerance=y_tolerance,
+        )
+    finally:
+        # Release pdfplumber's cached char/layout objects for this page
+        page.flush_cache()
+    return idx0, page_text
+
+
 def pdf_to_txt_parity_boxes(
     pdf_path: Path,
     out_path: Path,
@@ -275,53 +558,67 @@ def pdf_to_txt_parity_boxes(
     default_cols: int = 3,
     header_ratio: float = 0.08,
     footer_ratio: float = 0.06,
-    x_tolerance: float = 1.0,
+    x_tolerance: Optional[float] = None,
     y_tolerance: float = 2.0,
     odd_cols_spec: Optional[str] = None,
     even_cols_spec: Optional[str] = None,
+    workers: Optional[int] = None,
+    engine: str = "pdfplumber",
 ) -> None:
     """
     Extract text for the page range using:
       - boxes defined by odd_cols_spec for odd pages,
       - boxes defined by even_cols_spec for even pages,
       - otherwise 'default_cols' equal columns.
-    Pages are 1-based for the user.
+    Pages are 1-based for the user. Pages are extracted in parallel by
+    'workers' processes (default: os.cpu_count()).
+    'engine' selects the PDF backend: "pdfplumber" or "fitz" (PyMuPDF,
+    faster; bold comes from the font flags instead of the font name).
     """
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        total = len(pdf.pages)
-        sp = max(1, start_page)
-        ep = end_page if end_page is not None else total
-        ep = max(sp, min(ep, total))
-
-        all_text: List[str] = []
-        for idx0 in range(sp - 1, ep):  # idx0 is 0-based
-            page = pdf.pages[idx0]
-            page_num = idx0 + 1  # 1-based
-            W = page.width
-
-            # Choose boxes: odd vs even
-            if (page_num % 2) == 1 and odd_cols_spec:
-                col_boxes = parse_cols_spec(odd_cols_spec, W)
-            elif (page_num % 2) == 0 and even_cols_spec:
-                col_boxes = parse_cols_spec(even_cols_spec, W)
-            else:
-                col_boxes = equal_columns(W, default_cols)
-
-            page_text = extract_page_columns(
-                page=page,
-                col_boxes=col_boxes,
-                header_ratio=header_ratio,
-                footer_ratio=footer_ratio,
-                x_tolerance=x_tolerance,
-                y_tolerance=y_tolerance,
-            )
-            if page_text:
-                all_text.append(page_text)
-
-    out_path.write_text("\n\n".join(all_text), encoding="utf-8")
+    if engine == "fitz":
+        fitz = _import_fitz()
+        with fitz.open(str(pdf_path)) as doc:
+            total = doc.page_count
+    else:
+        import pdfplumber
+
+        with pdfplumber.open(str(pdf_path)) as pdf:
+            total = _count_pages(pdf)
+    sp = max(1, start_page)
+    ep = end_page if end_page is not None else total
+    ep = max(sp, min(ep, total))
+
+    # Pages are independent: each worker process opens the PDF once and
+    # extracts the pages it is handed
+    extract = partial(
+        _extract_one_page,
+        odd_cols_spec=odd_cols_spec,
+        even_cols_spec=even_cols_spec,
+        header_ratio=header_ratio,
+        footer_ratio=footer_ratio,
+        x_tolerance=x_tolerance,
+        y_tolerance=y_tolerance,
+        default_cols=default_cols,
+        engine=engine,
+    )
+    # Results come back in page order; write each page as soon as it is ready
+    n_workers = min(workers or os.cpu_count() or 1, ep - sp + 1)
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(pdf_path, engine, sp, ep),
+    ) as ex, out_path.open("w", encoding="utf-8") as fp:
+        first = True
+        for _, page_text in ex.map(extract, range(sp - 1, ep)):  # idx0 is 0-based
+            if not page_text:
+                continue
+            if not first:
+                fp.write("\n\n")
+            fp.write(page_text)
+            first = False
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -335,19 +632,26 @@ def main(argv: Optional[list[str]] = None) -> int:
     ap.add_argument("--default-cols", type=int, default=3, help="Number of columns if no spec is provided. Default: 3")
     ap.add_argument("--header-ratio", type=float, default=0.08, help="Top crop ratio [0..1]. Default: 0.08")
     ap.add_argument("--footer-ratio", type=float, default=0.06, help="Bottom crop ratio [0..1]. Default: 0.06")
-    ap.add_argument("--x-tolerance", type=float, default=1.0, help="Kept for interface parity. Default: 1.0")
+    ap.add_argument("--x-tolerance", type=float, default=None, help="Max x-gap (points) between chars of one word. Default: 0.25 x font size")
     ap.add_argument("--y-tolerance", type=float, default=2.0, help="Line grouping tolerance. Default: 2.0")
     ap.add_argument(
         "--odd-cols",
         type=str,
         default=None,
-        help='Column spec for ODD pages, e.g. "0:180,180:360,360:540" or "0%:33.3%,33.3%:66.6%,66.6%:100%"',
+        help='Column spec for ODD pages, e.g. "0:180,180:360,360:540" or "0%%:33.3%%,33.3%%:66.6%%,66.6%%:100%%"',
     )
     ap.add_argument(
         "--even-cols",
         type=str,
         default=None,
-        help='Column spec for EVEN pages, e.g. "10:200,210:400,410:590" or "0%:32%,34%:66%,68%:100%"',
+        help='Column spec for EVEN pages, e.g. "10:200,210:400,410:590" or "0%%:32%%,34%%:66%%,68%%:100%%"',
+    )
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes. Default: CPU count")
+    ap.add_argument(
+        "--engine",
+        choices=("pdfplumber", "fitz"),
+        default="pdfplumber",
+        help="PDF backend; 'fitz' requires PyMuPDF. Default: pdfplumber",
     )
 
     args = ap.parse_args(argv)
@@ -365,6 +669,8 @@ def main(argv: Optional[list[str]] = None) -> int:
             y_tolerance=args.y_tolerance,
             odd_cols_spec=args.odd_cols,
             even_cols_spec=args.even_cols,
+            workers=args.workers,
+            engine=args.engine,
         )
     except Exception as e:
         sys.stderr.write(f"Error: {e}\n")